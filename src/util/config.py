@@ -1,30 +1,44 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel, HttpUrl, ValidationError, UUID4
+from pydantic import BaseModel, ConfigDict, HttpUrl, ValidationError, UUID4
 
 class GameConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     scenario: Literal[1, 2, 3]  # only 3 scenarios
     url: HttpUrl
     playerId: UUID4
 
 class UIConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool
 
 class AppConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     game: GameConfig
     ui: UIConfig
 
+# libyaml-backed loader when available, pure-Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def load_config(path: Path = Path("config.yaml")) -> AppConfig:
+    return _load_config(str(path.resolve()))
+
+@lru_cache(maxsize=1)
+def _load_config(path: str) -> AppConfig:
     load_dotenv()
 
-    with path.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+    with open(path, "r", encoding="utf-8") as f:
+        raw = yaml.load(f, Loader=_YamlLoader)
 
     raw["game"]["playerId"] = os.environ["PLAYER_ID"]
     try:
-        return AppConfig(**raw)
+        return AppConfig.model_validate(raw)
     except ValidationError as e:
         raise SystemExit(f"Invalid config: {e}")